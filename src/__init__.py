@@ -20,15 +20,23 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 import os
+import shutil
+# `subprocess` only runs a fixed `git status` command without a shell
+import subprocess  # nosec B404
 import sys
-from typing import Iterable
+from pathlib import Path
+from typing import Dict, Iterable
 
 from omegaconf import OmegaConf
 
+# Cache of the parsed short SHA, keyed by the `clean` flag
+_GIT_SHA_CACHE: Dict[bool, str] = {}
+
 # export project root directory
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 os.environ["PROJECT_ROOT"] = project_root
-sys.path.append(project_root)
+if project_root not in sys.path:
+    sys.path.append(project_root)
 
 # Disable Tensorflow Warnings
 os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
@@ -37,7 +45,100 @@ os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
 # Register custom resolvers for `OmegaConf`
 def join_string_underscore(texts: Iterable[str]) -> str:
     """Join strings with underscore."""
-    return "_".join(str(item) for item in texts)
+    return "_".join(map(str, texts))
+
+
+def _find_git_dir(root: str) -> Path:
+    """Find the git directory of the repository containing ``root``.
+
+    Args:
+        root (str): The directory to start searching from. Parent directories
+            are searched if it is not the top level of a git repository.
+
+    Returns:
+        Path: The git directory, following the ``gitdir`` pointer used by
+            worktrees and submodules.
+
+    Raises:
+        RuntimeError: If no git repository is found.
+    """
+    for directory in (Path(root).absolute(), *Path(root).absolute().parents):
+        git_dir = Path(directory, ".git")
+        if git_dir.is_dir():
+            return git_dir
+        if git_dir.is_file():
+            content = git_dir.read_text().strip()
+            if content.startswith("gitdir: "):
+                return Path(directory, content[len("gitdir: ") :])
+
+    raise RuntimeError(f"Git repository not found from <{root}>!")
+
+
+def _read_git_sha(root: str) -> str:
+    """Read the full SHA of the current ``HEAD`` commit from git files.
+
+    Args:
+        root (str): The directory to start searching for the git repository.
+
+    Returns:
+        str: The full SHA of the current ``HEAD`` commit.
+
+    Raises:
+        RuntimeError: If the repository or the ``HEAD`` reference is not found.
+    """
+    git_dir = _find_git_dir(root)
+    head = Path(git_dir, "HEAD").read_text().strip()
+    if not head.startswith("ref: "):
+        # detached HEAD stores the commit SHA directly
+        return head
+
+    # worktrees keep shared references in the common git directory
+    common_dir = git_dir
+    if Path(git_dir, "commondir").is_file():
+        common_dir = Path(git_dir, Path(git_dir, "commondir").read_text().strip())
+
+    ref = head[len("ref: ") :]
+    for ref_dir in (git_dir, common_dir):
+        ref_file = Path(ref_dir, ref)
+        if ref_file.is_file():
+            return ref_file.read_text().strip()
+
+    # fall back to packed references after `git gc` or fresh clones
+    packed_refs = Path(common_dir, "packed-refs")
+    if packed_refs.is_file():
+        for line in packed_refs.read_text().splitlines():
+            if line.endswith(f" {ref}"):
+                return line.split(" ", 1)[0]
+
+    raise RuntimeError(f"Failed to resolve git reference <{ref}>!")
+
+
+def _is_git_dirty(root: str) -> bool:
+    """Check whether tracked files in the git repository have changes.
+
+    Args:
+        root (str): The root directory of the git repository.
+
+    Returns:
+        bool: `True` if there are uncommitted changes, otherwise `False`.
+
+    Raises:
+        RuntimeError: If the `git` executable is not found.
+    """
+    git = shutil.which("git")
+    if git is None:
+        raise RuntimeError("Cannot check git repository status: `git` not found!")
+
+    # the command is fixed and runs the resolved `git` binary without a shell
+    status = subprocess.run(  # nosec B603
+        [git, "status", "--porcelain", "--untracked-files=no"],
+        cwd=root,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    return bool(status.stdout.strip())
 
 
 def parse_git_sha(clean: bool = False) -> str:
@@ -51,37 +152,38 @@ def parse_git_sha(clean: bool = False) -> str:
         str: The short SHA of the current git repository.
 
     Raises:
-        RuntimeError: If the repository is not clean and `clean
+        RuntimeError: If the repository is not clean and `clean` is True.
     """
-    import git
+    if clean in _GIT_SHA_CACHE:
+        return _GIT_SHA_CACHE[clean]
 
-    repo = git.Repo(search_parent_directories=True)
-    sha = str(repo.head.object.hexsha)
-    short_sha = str(repo.git.rev_parse(sha, short=7))
-    is_clean = not repo.is_dirty()
+    sha = _read_git_sha(project_root)
+    short_sha = sha[:7]
 
-    if clean and not is_clean:
+    # only spawn `git` when the working tree status is required
+    if clean and _is_git_dirty(project_root):
         raise RuntimeError(
             "Clean your git repository before running experiments! "
-            f"GIT SHA: {sha}, Status: {'Clean' if is_clean else 'Dirty'}"
+            f"GIT SHA: {sha}, Status: Dirty"
         )
-        os._exit(1)
 
-    os.environ["PROJECT_GIT_SHA"] = sha
-    os.environ["PROJECT_GIT_SHORT_SHA"] = short_sha
+    os.environ.update({"PROJECT_GIT_SHA": sha, "PROJECT_GIT_SHORT_SHA": short_sha})
+    _GIT_SHA_CACHE[clean] = short_sha
 
     return short_sha
 
 
-OmegaConf.register_new_resolver(
-    "join_string_underscore",
-    join_string_underscore,
-    replace=False,
-    use_cache=False,
-)
-OmegaConf.register_new_resolver(
-    "parse_git_sha",
-    lambda clean: parse_git_sha(clean=clean),
-    replace=False,
-    use_cache=False,
-)
+if not OmegaConf.has_resolver("join_string_underscore"):
+    OmegaConf.register_new_resolver(
+        "join_string_underscore",
+        join_string_underscore,
+        replace=False,
+        use_cache=False,
+    )
+if not OmegaConf.has_resolver("parse_git_sha"):
+    OmegaConf.register_new_resolver(
+        "parse_git_sha",
+        lambda clean: parse_git_sha(clean=clean),
+        replace=False,
+        use_cache=False,
+    )
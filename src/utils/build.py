@@ -53,12 +53,15 @@ def build_callbacks(cfg: Optional[DictConfig] = None) -> List[Callback]:
             "Expect `cfg` to be a `DictConfig` object, " f"but got {type(cfg).__name__}."
         )
 
-    for _, callback_cfg in cfg.items():
+    for callback_cfg in cfg.values():
         # only instantiate if the config is a DictConfig and has `_target_` key
-        if isinstance(callback_cfg, DictConfig) and "_target_" in callback_cfg:
-            LOGGER.info(f"Building callback <{callback_cfg._target_}>...")
+        if type(callback_cfg) is not DictConfig:
+            continue
+        if "_target_" in callback_cfg:
+            target = callback_cfg._target_
+            LOGGER.info(f"Building callback <{target}>...")
             callbacks.append(hydra.utils.instantiate(callback_cfg))
-            LOGGER.info(f"Building callback <{callback_cfg._target_}>...DONE!")
+            LOGGER.info(f"Building callback <{target}>...DONE!")
 
     return callbacks
 
@@ -83,11 +86,14 @@ def build_loggers(cfg: Optional[DictConfig] = None) -> List[Logger]:
             "Expect `cfg` to be a `DictConfig` object, " f"but got {type(cfg).__name__}."
         )
 
-    for _, logger_cfg in cfg.items():
+    for logger_cfg in cfg.values():
         # only instantiate if the config is a DictConfig and has `_target_` key
-        if isinstance(logger_cfg, DictConfig) and "_target_" in logger_cfg:
-            LOGGER.info(f"Building logger <{logger_cfg._target_}>...")
+        if type(logger_cfg) is not DictConfig:
+            continue
+        if "_target_" in logger_cfg:
+            target = logger_cfg._target_
+            LOGGER.info(f"Building logger <{target}>...")
             loggers.append(hydra.utils.instantiate(logger_cfg))
-            LOGGER.info(f"Building logger <{logger_cfg._target_}>...DONE!")
+            LOGGER.info(f"Building logger <{target}>...DONE!")
 
     return loggers
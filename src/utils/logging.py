@@ -22,28 +22,68 @@
 """Helper functions for Python logging system."""
 import logging
 import os
+from functools import lru_cache
+from typing import Any
 
 from lightning.pytorch.core.module import LightningModule
 from lightning.pytorch.trainer import Trainer
 from lightning.pytorch.utilities import rank_zero_only
-from omegaconf import DictConfig
+from omegaconf import Container, DictConfig, OmegaConf
 from torch.nn import Module
 
+# Constants
+_LOG_LEVEL_METHOD_NAMES = tuple(
+    name.lower() for name in logging._nameToLevel.keys() if name != "NOTSET"
+)
 
+
+@lru_cache(maxsize=None)
 def get_log_level() -> int:
     """Get the log level from environment variable.
 
+    .. note::
+        The result is cached for the lifetime of the process. Call
+        ``get_log_level.cache_clear()`` after changing ``LOG_LEVEL``.
+
     Returns:
         int: The log level.
+
+    Raises:
+        ValueError: If the log level is invalid.
     """
-    level = os.environ.get("LOG_LEVEL", "INFO").upper()
-    level = logging._nameToLevel.get(level, None)
-    if not isinstance(level, int):
-        raise ValueError(f"Invalid log level: {level}")
+    level_name = os.environ.get("LOG_LEVEL", "INFO").upper()
+    level = logging._nameToLevel.get(level_name)
+    if level is None:
+        raise ValueError(f"Invalid log level: {level_name}")
 
     return level
 
 
+@lru_cache(maxsize=None)
+def _build_logger(name: str) -> logging.Logger:
+    """Build a logger with all logging levels marked as rank zero only.
+
+    Args:
+        name (str): The name of the logger.
+
+    Returns:
+        logging.Logger: The logger object.
+    """
+    logger = logging.getLogger(name)
+
+    # skip loggers that have already been decorated elsewhere
+    if getattr(logger, "_rank_zero_wrapped", False):
+        return logger
+
+    # use `rank_zero_only` to ensure that all logging levels get marked with
+    # rank zero decorator, and avoid duplicate logging from each process.
+    for level_name in _LOG_LEVEL_METHOD_NAMES:
+        setattr(logger, level_name, rank_zero_only(getattr(logger, level_name)))
+    logger._rank_zero_wrapped = True  # type: ignore[attr-defined]
+
+    return logger
+
+
 def get_logger(name=__name__) -> logging.Logger:
     """Initialize the logger service.
 
@@ -56,22 +96,30 @@ def get_logger(name=__name__) -> logging.Logger:
     Raises:
         ValueError: If the log level is invalid.
     """
-
-    # get level
-    logger = logging.getLogger(name)
+    # re-apply levels on every call in case they were reconfigured, e.g., by Hydra
     level = get_log_level()
+    logger = _build_logger(name)
     logging.root.setLevel(level)
     logger.setLevel(level)
 
-    # use `rank_zero_only` to ensure that all logging levels get marked with
-    # rank zero decorator, and avoid duplicate logging from each process.
-    logging_levels = [name.lower() for name in logging._nameToLevel.keys() if name != "NOTSET"]
-    for level in logging_levels:
-        setattr(logger, level, rank_zero_only(getattr(logger, level)))
-
     return logger
 
 
+def _to_primitive(value: Any) -> Any:
+    """Convert a configuration node to primitive containers if needed.
+
+    Args:
+        value (Any): The configuration node or value.
+
+    Returns:
+        Any: The resolved primitive container, or the value itself.
+    """
+    if isinstance(value, Container):
+        return OmegaConf.to_container(value, resolve=True)
+
+    return value
+
+
 @rank_zero_only
 def log_hyperparams(params: dict) -> None:
     """Controls which config parts are to be logged by lightning loggers.
@@ -94,24 +142,26 @@ def log_hyperparams(params: dict) -> None:
         return
 
     # log the number of model parameters
-    hparams["model"] = cfg["model"]
-    hparams["model/params/total"] = sum(p.numel() for p in model.parameters())
-    hparams["model/params/trainable"] = sum(
-        p.numel() for p in model.parameters() if p.requires_grad
-    )
-    hparams["model/params/non_trainable"] = sum(
-        p.numel() for p in model.parameters() if not p.requires_grad
-    )
+    hparams["model"] = _to_primitive(cfg["model"])
+    total, trainable = 0, 0
+    for p in model.parameters():
+        numel = p.numel()
+        total += numel
+        if p.requires_grad:
+            trainable += numel
+    hparams["model/params/total"] = total
+    hparams["model/params/trainable"] = trainable
+    hparams["model/params/non_trainable"] = total - trainable
 
     # log configurations
-    hparams["callbacks"] = cfg.get("callbacks")
-    hparams["checkpoint"] = cfg.get("checkpoint")
-    hparams["dataset"] = cfg["dataset"]
-    hparams["extras"] = cfg.get("extras")
-    hparams["task"] = cfg.get("task")
-    hparams["seed"] = cfg.get("seed")
-    hparams["tags"] = cfg.get("tags")
-    hparams["trainer"] = cfg["trainer"]
+    hparams["callbacks"] = _to_primitive(cfg.get("callbacks"))
+    hparams["checkpoint"] = _to_primitive(cfg.get("checkpoint"))
+    hparams["dataset"] = _to_primitive(cfg["dataset"])
+    hparams["extras"] = _to_primitive(cfg.get("extras"))
+    hparams["task"] = _to_primitive(cfg.get("task"))
+    hparams["seed"] = _to_primitive(cfg.get("seed"))
+    hparams["tags"] = _to_primitive(cfg.get("tags"))
+    hparams["trainer"] = _to_primitive(cfg["trainer"])
 
     # log the hyperparameters
     for logger in trainer.loggers:
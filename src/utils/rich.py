@@ -23,12 +23,12 @@
 from pathlib import Path
 from typing import Sequence
 
-import rich
 import rich.syntax as rsyntax
 import rich.tree as rtree
 from hydra.core.hydra_config import HydraConfig
 from lightning.pytorch.utilities import rank_zero_only
 from omegaconf import DictConfig, OmegaConf, open_dict
+from rich.console import Console
 from rich.prompt import Prompt
 
 from src.utils.logging import get_logger
@@ -52,14 +52,15 @@ def enforce_tags(cfg: DictConfig, save_to_file: bool = False) -> None:
 
         LOGGER.info("No tags specified. Now prompting user to input tags.")
         tags = Prompt.ask("Please input tags (separated by comma):")
-        tags = [tag.strip() for tag in tags.split(",") if tag != ""]
+        tags = [tag for tag in (t.strip() for t in tags.split(",")) if tag]
         with open_dict(cfg):
             cfg.tags = tags
         LOGGER.info(f"Tags updated: {tags}")
 
     if save_to_file:
         with open(Path(cfg.paths.output_dir, "tags.txt"), "w") as f:
-            rich.print(cfg.tags, file=f)
+            tags = cfg.tags if isinstance(cfg.tags, str) else ",".join(map(str, cfg.tags))
+            f.write(f"{tags}\n")
 
 
 @rank_zero_only
@@ -92,18 +93,23 @@ def print_config_tree(
     style = "dim"
     tree = rtree.Tree("CONFIG", style=style, guide_style=style)
     queue = []
+    missing = []
 
     # add fields to queue following the print order
     for field in print_order:
         if field in cfg:
             queue.append(field)
         else:
-            LOGGER.info(f"Field '{field}' not found in config, skipping...")
+            missing.append(field)
+    if missing:
+        LOGGER.info(f"Fields {missing} not found in config, skipping...")
 
     # add the rest other fields to the queue
+    queued = set(queue)
     for field in cfg:
-        if field not in queue:
+        if field not in queued:
             queue.append(field)
+            queued.add(field)
 
     # generate configuration tree from queue
     for field in queue:
@@ -116,10 +122,10 @@ def print_config_tree(
 
         branch.add(rsyntax.Syntax(branch_content, "yaml", line_numbers=False))
 
-    # print the configuration tree
-    rich.print(tree)
+    # print the configuration tree, recording the output for saving
+    console = Console(record=save_to_file)
+    console.print(tree)
 
-    # save config tree to file
+    # save the recorded config tree to file
     if save_to_file:
-        with open(Path(cfg.paths.output_dir, "config_tree.txt"), "w") as f:
-            rich.print(tree, file=f)
+        console.save_text(str(Path(cfg.paths.output_dir, "config_tree.txt")))
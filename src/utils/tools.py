@@ -24,13 +24,14 @@ import warnings
 from importlib.util import find_spec
 from typing import Any, Callable, Dict, Optional, Tuple
 
-from omegaconf import DictConfig
+from omegaconf import DictConfig, OmegaConf
 
 from src.utils.logging import get_logger
 from src.utils.rich import enforce_tags, print_config_tree
 
 # Constants
 LOGGER = get_logger(__name__)
+_WANDB_AVAILABLE = find_spec("wandb") is not None
 
 
 def apply_extras(cfg: DictConfig) -> None:
@@ -47,11 +48,14 @@ def apply_extras(cfg: DictConfig) -> None:
         cfg (DictConfig): The configuration dictionary.
     """
     # skip if no `extras` section is found
-    if not cfg.get("extras"):
+    extras_cfg = cfg.get("extras")
+    if not extras_cfg:
         LOGGER.info("Extras section not found. Skipping...")
         return
 
-    extras: DictConfig = cfg.extras
+    # convert once so that the flags below are plain dictionary lookups
+    extras = OmegaConf.to_container(extras_cfg, resolve=True)
+    assert isinstance(extras, dict)
     # disable python warnings
     if extras.get("ignore_warnings"):
         LOGGER.info("Disabling Python warnings! <extras.ignore_warnings=True>")
@@ -152,7 +156,7 @@ def task_wrapper(
             LOGGER.info(f"All logs are saved to {cfg.paths.output_dir}.")
 
             # close wandb logger if it is used
-            if find_spec("wandb"):
+            if _WANDB_AVAILABLE:
                 import wandb  # type: ignore
 
                 if wandb.run:
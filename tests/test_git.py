@@ -0,0 +1,118 @@
+import shutil
+# `subprocess` only drives `git` for a throwaway test repository
+import subprocess  # nosec B404
+from pathlib import Path
+
+import pytest
+
+from src import _read_git_sha
+
+SHA = "0123456789abcdef0123456789abcdef01234567"
+OTHER_SHA = "fedcba9876543210fedcba9876543210fedcba98"
+
+
+def _make_git_dir(root: Path, head: str) -> Path:
+    """Create a minimal `.git` directory with the given `HEAD` content.
+
+    :param root: The directory in which the `.git` directory is created.
+    :param head: The content of the `HEAD` file.
+
+    :return: The path to the created `.git` directory.
+    """
+    git_dir = root / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text(f"{head}\n")
+
+    return git_dir
+
+
+def _git(*args: str, cwd: Path) -> str:
+    """Run a git command and return its stripped output.
+
+    :param args: The git command line arguments.
+    :param cwd: The working directory of the command.
+
+    :return: The stripped standard output.
+    """
+    # test-only helper running `git` from PATH without a shell
+    result = subprocess.run(  # nosec B603 B607
+        ["git", *args], cwd=cwd, capture_output=True, check=True, text=True
+    )
+
+    return result.stdout.strip()
+
+
+def test_read_git_sha_detached_head(tmp_path: Path) -> None:
+    """Tests reading the SHA stored directly in a detached `HEAD`.
+
+    :param tmp_path: The temporary directory.
+    """
+    _make_git_dir(tmp_path, SHA)
+    assert _read_git_sha(str(tmp_path)) == SHA
+
+
+def test_read_git_sha_loose_ref(tmp_path: Path) -> None:
+    """Tests resolving `HEAD` through a loose branch reference.
+
+    :param tmp_path: The temporary directory.
+    """
+    git_dir = _make_git_dir(tmp_path, "ref: refs/heads/main")
+    (git_dir / "refs" / "heads" / "main").write_text(f"{SHA}\n")
+    assert _read_git_sha(str(tmp_path)) == SHA
+
+
+def test_read_git_sha_packed_ref(tmp_path: Path) -> None:
+    """Tests resolving `HEAD` through the `packed-refs` file.
+
+    :param tmp_path: The temporary directory.
+    """
+    git_dir = _make_git_dir(tmp_path, "ref: refs/heads/main")
+    (git_dir / "packed-refs").write_text(
+        "# pack-refs with: peeled fully-peeled sorted\n"
+        f"{OTHER_SHA} refs/heads/dev\n"
+        f"{SHA} refs/heads/main\n"
+        f"^{OTHER_SHA}\n"
+    )
+    assert _read_git_sha(str(tmp_path)) == SHA
+
+
+def test_read_git_sha_missing_ref(tmp_path: Path) -> None:
+    """Tests that an unresolvable reference raises `RuntimeError`.
+
+    :param tmp_path: The temporary directory.
+    """
+    _make_git_dir(tmp_path, "ref: refs/heads/main")
+    with pytest.raises(RuntimeError):
+        _read_git_sha(str(tmp_path))
+
+
+def test_read_git_sha_nested_dir(tmp_path: Path) -> None:
+    """Tests finding the repository from a nested project directory.
+
+    :param tmp_path: The temporary directory.
+    """
+    git_dir = _make_git_dir(tmp_path, "ref: refs/heads/main")
+    (git_dir / "refs" / "heads" / "main").write_text(f"{SHA}\n")
+    nested = tmp_path / "projects" / "template"
+    nested.mkdir(parents=True)
+    assert _read_git_sha(str(nested)) == SHA
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="Requires: [git]")
+def test_read_git_sha_worktree(tmp_path: Path) -> None:
+    """Tests resolving `HEAD` of a linked worktree with loose and packed references.
+
+    :param tmp_path: The temporary directory.
+    """
+    main = tmp_path / "main"
+    main.mkdir()
+    _git("init", "-q", cwd=main)
+    _git("config", "user.name", "test", cwd=main)
+    _git("config", "user.email", "test@example.com", cwd=main)
+    _git("commit", "-q", "--allow-empty", "-m", "init", cwd=main)
+    worktree = tmp_path / "worktree"
+    _git("worktree", "add", "-q", "-b", "feature", str(worktree), cwd=main)
+    assert _read_git_sha(str(worktree)) == _git("rev-parse", "HEAD", cwd=worktree)
+
+    _git("pack-refs", "--all", cwd=main)
+    assert _read_git_sha(str(worktree)) == _git("rev-parse", "HEAD", cwd=worktree)